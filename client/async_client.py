@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+import httpx
+
+from common.schemas import MAX_BATCH, SubmitTaskRequest
+
+SERVER_BASE = os.getenv("DTQ_SERVER_BASE", "http://127.0.0.1:8000")
+CLIENT_KEY = os.getenv("DTQ_CLIENT_API_KEY", "client-dev-key")
+
+FINAL_STATUSES = ("DONE", "FAILED")
+
+
+class TaskNotFound(LookupError):
+    pass
+
+
+class AsyncTaskClient:
+    """Async client for the task server.
+
+    submit() calls are buffered and sent together through /client/tasks/batch,
+    flushed when `batch_size` tasks are queued or `batch_interval` seconds have
+    passed since the first one. wait_result() calls share a single poller that
+    asks for every outstanding task in one request per `poll_interval`.
+
+    HTTP/2 is only used when the server offers it over TLS (ALPN); against
+    plain http:// or uvicorn the pool falls back to HTTP/1.1 keep-alive.
+    """
+
+    def __init__(
+        self,
+        base_url: str = SERVER_BASE,
+        api_key: str = CLIENT_KEY,
+        *,
+        http2: bool = True,
+        max_connections: int = 20,
+        timeout: float = 10.0,
+        batch_size: int = 100,
+        batch_interval: float = 0.01,
+        poll_interval: float = 0.5,
+        max_attempts: int = 4,
+        backoff_base: float = 0.2,
+        backoff_max: float = 5.0,
+    ):
+        if not 1 <= batch_size <= MAX_BATCH:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH}")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            headers={"X-API-Key": api_key},
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._pending: List[Tuple[dict, asyncio.Future]] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: set[asyncio.Task] = set()
+
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._poller: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncTaskClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        self._flush_now()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        if self._poller:
+            self._poller.cancel()
+            await asyncio.gather(self._poller, return_exceptions=True)
+            self._poller = None
+        for futs in self._waiters.values():
+            for fut in futs:
+                if not fut.done():
+                    fut.cancel()
+        self._waiters.clear()
+        await self._http.aclose()
+
+    # -------- HTTP --------
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                resp = await self._http.request(method, path, **kwargs)
+                if resp.status_code < 500:
+                    resp.raise_for_status()
+                    return resp.json()
+                if attempt >= self.max_attempts:
+                    resp.raise_for_status()
+            except httpx.TransportError:
+                if attempt >= self.max_attempts:
+                    raise
+            delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+    # -------- Submit --------
+    async def submit(
+        self,
+        type_: str,
+        payload: Optional[Dict[str, Any]] = None,
+        max_retries: int = 3,
+        timeout_seconds: int = 30,
+    ) -> str:
+        # validate up front so a bad spec fails its own caller, not the whole batch
+        spec = SubmitTaskRequest(
+            type=type_,
+            payload=payload or {},
+            max_retries=max_retries,
+            timeout_seconds=timeout_seconds,
+        ).model_dump()
+        return await self._enqueue(spec)
+
+    async def submit_many(self, specs: Iterable[Dict[str, Any]]) -> List[str]:
+        # specs use the SubmitTaskRequest shape: {"type": ..., "payload": ..., ...}
+        validated = [SubmitTaskRequest.model_validate(spec).model_dump() for spec in specs]
+        return list(await asyncio.gather(*(self._enqueue(spec) for spec in validated)))
+
+    async def _enqueue(self, spec: dict) -> str:
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append((spec, fut))
+
+        if len(self._pending) >= self.batch_size:
+            self._flush_now()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(self.batch_interval, self._flush_now)
+        return await fut
+
+    def _flush_now(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        # callers that gave up before the flush should not create tasks
+        self._pending = [(spec, fut) for spec, fut in self._pending if not fut.cancelled()]
+        while self._pending:
+            batch = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+            t = asyncio.get_running_loop().create_task(self._send_batch(batch))
+            self._flushes.add(t)
+            t.add_done_callback(self._flushes.discard)
+
+    async def _send_batch(self, batch: List[Tuple[dict, asyncio.Future]]) -> None:
+        # same batch_id on every retry so the server never enqueues the batch twice
+        body = {"tasks": [spec for spec, _ in batch], "batch_id": uuid4().hex}
+        try:
+            data = await self._request("POST", "/client/tasks/batch", json=body)
+            task_ids = data["task_ids"]
+            if len(task_ids) != len(batch):
+                raise RuntimeError(f"Batch of {len(batch)} tasks returned {len(task_ids)} task ids")
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        for (_, fut), task_id in zip(batch, task_ids):
+            if not fut.done():
+                fut.set_result(task_id)
+
+    # -------- Query --------
+    async def get_task(self, task_id: str) -> Dict[str, Any]:
+        return await self._request("GET", f"/client/tasks/{task_id}")
+
+    async def get_result(self, task_id: str) -> Dict[str, Any]:
+        return await self._request("GET", f"/client/tasks/{task_id}/result")
+
+    async def get_results(self, task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = {}
+        for i in range(0, len(task_ids), MAX_BATCH):
+            data = await self._request("POST", "/client/tasks/results", json={"task_ids": task_ids[i:i + MAX_BATCH]})
+            out.update(data["results"])
+        return out
+
+    async def wait_result(self, task_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(task_id, []).append(fut)
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.get_running_loop().create_task(self._poll_loop())
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        finally:
+            futs = self._waiters.get(task_id)
+            if futs and fut in futs:
+                futs.remove(fut)
+                if not futs:
+                    del self._waiters[task_id]
+            if not self._waiters and self._poller:
+                # drop the reference now: the cancelled task is not done() until
+                # the cancellation lands, and a new waiter must start a fresh poller
+                self._poller.cancel()
+                self._poller = None
+
+    async def wait_results(self, task_ids: Iterable[str], timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        waits = [asyncio.ensure_future(self.wait_result(tid, timeout)) for tid in task_ids]
+        try:
+            return list(await asyncio.gather(*waits))
+        except BaseException:
+            # stop polling for the ids nobody is waiting on anymore
+            for w in waits:
+                w.cancel()
+            await asyncio.gather(*waits, return_exceptions=True)
+            raise
+
+    async def _poll_loop(self) -> None:
+        while self._waiters:
+            task_ids = list(self._waiters)
+            try:
+                results = await self.get_results(task_ids)
+            except Exception as e:
+                self._resolve_all(exc=e)
+                return
+
+            for tid in task_ids:
+                res = results.get(tid)
+                if res is None:
+                    self._resolve(tid, exc=TaskNotFound(tid))
+                elif res["status"] in FINAL_STATUSES:
+                    self._resolve(tid, result=res)
+
+            if self._waiters:
+                await asyncio.sleep(self.poll_interval)
+
+    def _resolve(self, task_id: str, result: Any = None, exc: Optional[BaseException] = None) -> None:
+        for fut in self._waiters.pop(task_id, []):
+            if fut.done():
+                continue
+            if exc is not None:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(result)
+
+    def _resolve_all(self, exc: BaseException) -> None:
+        for tid in list(self._waiters):
+            self._resolve(tid, exc=exc)
@@ -1,36 +1,24 @@
 from __future__ import annotations
 
-import os
-import time
-import httpx
+import asyncio
 
-SERVER_BASE = os.getenv("DTQ_SERVER_BASE", "http://127.0.0.1:8000")
-CLIENT_KEY = os.getenv("DTQ_CLIENT_API_KEY", "client-dev-key")
+from client.async_client import AsyncTaskClient
 
 
-def main():
-    headers = {"X-API-Key": CLIENT_KEY}
-    with httpx.Client(timeout=10.0) as c:
+async def main():
+    async with AsyncTaskClient() as c:
 
-        r = c.post(
-            f"{SERVER_BASE}/client/tasks",
-            json={"type": "add", "payload": {"a": 10, "b": 32}, "max_retries": 3, "timeout_seconds": 10},
-            headers=headers,
+        task_ids = await c.submit_many(
+            {"type": "add", "payload": {"a": i, "b": 32}, "max_retries": 3, "timeout_seconds": 10}
+            for i in range(10)
         )
-        r.raise_for_status()
-        task_id = r.json()["task_id"]
-        print("Submitted:", task_id)
+        print("Submitted:", len(task_ids))
 
-        # poll
-        while True:
-            st = c.get(f"{SERVER_BASE}/client/tasks/{task_id}", headers=headers).json()
-            print("Status:", st["status"])
-            if st["status"] in ("DONE", "FAILED"):
-                res = c.get(f"{SERVER_BASE}/client/tasks/{task_id}/result", headers=headers).json()
-                print("Result:", res)
-                break
-            time.sleep(0.5)
+        # one poll request per interval covers every task
+        results = await c.wait_results(task_ids, timeout=60)
+        for task_id, res in zip(task_ids, results):
+            print(task_id, res["status"], res["result"] or res["error"])
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
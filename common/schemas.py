@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 
+# max items per /client/tasks/batch and /client/tasks/results request
+MAX_BATCH = 500
+
+
 class TaskStatus(str, Enum):
     PENDING = "PENDING"
     RUNNING = "RUNNING"
@@ -27,6 +31,35 @@ class SubmitTaskResponse(BaseModel):
     task_id: str
 
 
+class SubmitTaskBatchRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    tasks: List[SubmitTaskRequest] = Field(min_length=1, max_length=MAX_BATCH)
+    # client-generated; resubmitting the same batch_id returns the original task ids
+    batch_id: Optional[str] = Field(default=None, min_length=1, max_length=64)
+
+
+class SubmitTaskBatchResponse(BaseModel):
+    task_ids: List[str]
+
+
+class TaskResultsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    task_ids: List[str] = Field(min_length=1, max_length=MAX_BATCH)
+
+
+class TaskResult(BaseModel):
+    status: TaskStatus
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class TaskResultsResponse(BaseModel):
+    # unknown task ids are omitted
+    results: Dict[str, TaskResult]
+
+
 class TaskView(BaseModel):
     task_id: str
     type: str
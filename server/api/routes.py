@@ -3,6 +3,8 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException
 from common.schemas import (
     SubmitTaskRequest, SubmitTaskResponse, TaskView,
+    SubmitTaskBatchRequest, SubmitTaskBatchResponse,
+    TaskResultsRequest, TaskResult, TaskResultsResponse,
     RegisterWorkerRequest, RegisterWorkerResponse,
     HeartbeatRequest, PullTaskResponse, ReportResultRequest
 )
@@ -36,6 +38,18 @@ def build_router(mgr: TaskManager) -> APIRouter:
         task_id = await mgr.submit(req.type, req.payload, req.max_retries, req.timeout_seconds)
         return SubmitTaskResponse(task_id=task_id)
 
+    @r.post("/client/tasks/batch", response_model=SubmitTaskBatchResponse, dependencies=[Depends(require_client_key)])
+    async def submit_task_batch(req: SubmitTaskBatchRequest):
+        task_ids = await mgr.submit_many([t.model_dump() for t in req.tasks], req.batch_id)
+        return SubmitTaskBatchResponse(task_ids=task_ids)
+
+    @r.post("/client/tasks/results", response_model=TaskResultsResponse, dependencies=[Depends(require_client_key)])
+    async def get_results(req: TaskResultsRequest):
+        tasks = await mgr.get_many(req.task_ids)
+        return TaskResultsResponse(results={
+            t.task_id: TaskResult(status=t.status, result=t.result, error=t.last_error) for t in tasks
+        })
+
     @r.get("/client/tasks/{task_id}", response_model=TaskView, dependencies=[Depends(require_client_key)])
     async def get_task(task_id: str):
         t = await mgr.get(task_id)
@@ -23,6 +23,14 @@ class InMemoryLeaseQueue:
             self._ready.append(task_id)
             self._ready_set.add(task_id)
 
+    async def push_ready_many(self, task_ids: list[str]) -> None:
+        async with self._lock:
+            for task_id in task_ids:
+                if task_id in self._inflight or task_id in self._ready_set:
+                    continue
+                self._ready.append(task_id)
+                self._ready_set.add(task_id)
+
     async def lease(self, worker_id: str, lease_seconds: int) -> Optional[str]:
         lease_until = datetime.utcnow() + timedelta(seconds=lease_seconds)
         async with self._lock:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from uuid import uuid4
 
 from common.schemas import TaskStatus
@@ -18,6 +18,7 @@ class TaskManager:
         self.queue = queue
         self.lease_seconds = lease_seconds
         self.tasks: Dict[str, Task] = {}
+        self.batches: Dict[str, List[str]] = {}
 
     async def submit(self, type_: str, payload: dict, max_retries: int, timeout_seconds: int) -> str:
         task_id = str(uuid4())
@@ -33,10 +34,37 @@ class TaskManager:
         await self.queue.push_ready(task_id)
         return task_id
 
+    async def submit_many(self, specs: List[dict], batch_id: Optional[str] = None) -> List[str]:
+        tasks = [
+            Task(
+                task_id=str(uuid4()),
+                type=spec["type"],
+                payload=spec["payload"],
+                max_retries=spec["max_retries"],
+                timeout_seconds=spec["timeout_seconds"],
+            )
+            for spec in specs
+        ]
+        task_ids = [t.task_id for t in tasks]
+        async with self._lock:
+            if batch_id is not None:
+                if batch_id in self.batches:
+                    # retried batch: already stored and queued
+                    return self.batches[batch_id]
+                self.batches[batch_id] = task_ids
+            for task in tasks:
+                self.tasks[task.task_id] = task
+        await self.queue.push_ready_many(task_ids)
+        return task_ids
+
     async def get(self, task_id: str) -> Optional[Task]:
         async with self._lock:
             return self.tasks.get(task_id)
 
+    async def get_many(self, task_ids: List[str]) -> List[Task]:
+        async with self._lock:
+            return [self.tasks[tid] for tid in task_ids if tid in self.tasks]
+
     async def pull_for_worker(self, worker_id: str) -> Optional[Task]:
 
         task_id = await self.queue.lease(worker_id=worker_id, lease_seconds=self.lease_seconds)